@@ -4,7 +4,7 @@ Expense Tracker (Streamlit Edition)
 This module implements a small personal expense tracking application with
 a Streamlit-based web UI. Users can:
 
-- Add, edit, delete, and filter expenses stored in data/expenses.csv
+- Add, edit, delete, and filter expenses stored in data/expenses.parquet
 - Manage categories stored in data/categories.json
 - View dashboards and summaries (by category, date, month)
 - Export filtered or full data sets as CSV files
@@ -18,19 +18,42 @@ The main entry point is the `main()` function at the bottom of this file.
 """
 
 import os
-import io
+import csv
 import json
 import datetime as dt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import streamlit as st
 import altair as alt  # for richer charts
 
 # ---------------- Paths / constants ----------------
 CSV_DIR = "data"
 REPORTS_DIR = os.path.join(CSV_DIR, "reports")
-CSV = os.path.join(CSV_DIR, "expenses.csv")
+EXPENSES = os.path.join(CSV_DIR, "expenses.parquet")
+# Pre-Parquet storage; migrated to EXPENSES on first run if present.
+LEGACY_CSV = os.path.join(CSV_DIR, "expenses.csv")
+# Append-only sidecar for new entries; merged on load, folded into EXPENSES
+# by save_df() or once it grows past INBOX_COMPACT_BYTES.
+INBOX = os.path.join(CSV_DIR, "inbox.csv")
+INBOX_COMPACT_BYTES = 64 * 1024
 DF_COLS = ["Date", "Amount", "Category", "Description"]
+# On-disk schema: calendar dates and a dictionary-encoded Category
+EXPENSES_SCHEMA = pa.schema(
+    [
+        ("Date", pa.date32()),
+        ("Amount", pa.float64()),
+        ("Category", pa.dictionary(pa.int32(), pa.string())),
+        ("Description", pa.string()),
+    ]
+)
 CATS_JSON = os.path.join(CSV_DIR, "categories.json")
+DATE_FMT = "%Y-%m-%d"
+# Show datetime Date columns as plain dates in st.dataframe tables
+DATE_COLUMN_CONFIG = {"Date": st.column_config.DateColumn("Date", format="YYYY-MM-DD")}
 
 DEFAULT_CATEGORIES = ["Food", "Transport", "Bills", "Groceries", "Health", "Other"]
 
@@ -47,50 +70,187 @@ CATEGORY_BUDGETS = {
 
 
 # ---------------- Bootstrap ----------------
+# Streamlit re-executes this script on every rerun, so a module-level flag
+# would not persist; st.cache_resource runs the folder setup once per process.
+@st.cache_resource(show_spinner=False)
+def _ensure_data_dirs() -> None:
+    """Create the data/ and data/reports/ directories (once per process)."""
+    os.makedirs(CSV_DIR, exist_ok=True)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+
+
 def ensure_dirs_and_csv() -> None:
-    """Ensure data folders and main CSV file exist.
+    """Ensure data folders and the main expenses file exist.
 
-    Creates the data/ and data/reports/ directories if needed and
-    initializes an empty expenses.csv file with the expected columns
-    if the file does not exist or is empty.
+    Creates the data/ and data/reports/ directories if needed. If
+    expenses.parquet does not exist yet, it is created from the legacy
+    expenses.csv (one-time migration) or initialized empty with the
+    expected columns. The file check runs on every call, so a data file
+    removed while the app is running is recreated.
     """
-    os.makedirs(CSV_DIR, exist_ok=True)
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    if not os.path.exists(CSV) or os.path.getsize(CSV) == 0:
-        pd.DataFrame(columns=DF_COLS).to_csv(CSV, index=False)
+    _ensure_data_dirs()
+    if os.path.exists(EXPENSES):
+        return
+    # The folders may have been removed along with the file
+    _ensure_data_dirs.clear()
+    _ensure_data_dirs()
+    if os.path.exists(LEGACY_CSV) and os.path.getsize(LEGACY_CSV) > 0:
+        legacy = pd.read_csv(LEGACY_CSV, dtype=str).reindex(columns=DF_COLS)
+        legacy["Date"] = legacy["Date"].fillna("")
+        legacy["Category"] = legacy["Category"].fillna("")
+        legacy["Description"] = legacy["Description"].fillna("")
+        save_df(legacy)
+    else:
+        save_df(pd.DataFrame(columns=DF_COLS))
 
 
-def load_df() -> pd.DataFrame:
-    """Load all expenses from CSV into a pandas DataFrame.
+def _data_mtimes() -> tuple[float, float]:
+    """Return the modification times of the Parquet file and the inbox.
+
+    Missing files report 0, so the pair can be used as a cache key.
+    """
+    mtime = os.path.getmtime(EXPENSES) if os.path.exists(EXPENSES) else 0
+    inbox_mtime = os.path.getmtime(INBOX) if os.path.exists(INBOX) else 0
+    return mtime, inbox_mtime
+
+
+@st.cache_data(show_spinner=False)
+def _load_df_cached(path: str, mtime: float, inbox_mtime: float) -> pd.DataFrame:
+    """Read the expenses Parquet file plus the inbox (cached per modification time).
+
+    Args:
+        path: Path to the expenses Parquet file.
+        mtime: Modification time of the file; only used as part of the cache key.
+        inbox_mtime: Modification time of INBOX; only used as part of the cache key.
 
     Returns:
-        A DataFrame with columns: Date, Amount, Category, Description.
-        If the CSV is empty or missing, an empty DataFrame is returned.
+        A DataFrame with columns: Date, Amount, Category, Description,
+        plus the derived `_search` column used by filter_df(). Rows are
+        sorted by Date; index labels keep each row's position on disk.
     """
-    ensure_dirs_and_csv()
-    if os.path.getsize(CSV) == 0:
-        return pd.DataFrame(columns=DF_COLS)
-    df = pd.read_csv(CSV, dtype=str)
+    df = pq.read_table(path).to_pandas(date_as_object=False)
+    if os.path.exists(INBOX) and os.path.getsize(INBOX) > 0:
+        # append_row() controls the inbox format, so parse it with known types
+        inbox = pd.read_csv(
+            INBOX,
+            header=None,
+            names=DF_COLS,
+            dtype={
+                "Amount": "float64",
+                "Category": "string[pyarrow]",
+                "Description": "string[pyarrow]",
+            },
+            parse_dates=["Date"],
+            date_format=DATE_FMT,
+            keep_default_na=False,
+            na_values={"Date": [""], "Amount": [""]},
+        )
+        df = pd.concat([df, inbox], ignore_index=True) if len(df) else inbox
     df = df.reindex(columns=DF_COLS)
-    # Normalize numeric and text columns
-    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0.0).round(2)
-    df["Category"] = df["Category"].fillna("").astype(str)
-    df["Description"] = df["Description"].fillna("").astype(str)
+    # Types are preserved by Parquet; text columns use Arrow-backed strings
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    # Sorted by date so filter_df() can bracket date ranges with searchsorted
+    df = df.sort_values("Date", kind="stable")
+    df["Description"] = df["Description"].astype("string[pyarrow]")
+    # Few distinct categories: integer codes make groupby/equality cheap
+    df["Category"] = df["Category"].astype("string[pyarrow]").astype("category")
+    # Lowercased search text for the keyword filter (never saved to disk)
+    df["_search"] = (
+        df["Date"].dt.strftime(DATE_FMT).fillna("").astype("string[pyarrow]")
+        + " "
+        + df["Amount"].map("{:.2f}".format).astype("string[pyarrow]")
+        + " "
+        + df["Category"].astype("string[pyarrow]")
+        + " "
+        + df["Description"]
+    ).str.lower()
     return df
 
 
+def load_df_with_version() -> tuple[pd.DataFrame, tuple[float, float]]:
+    """Load all expenses together with the data version they were read at.
+
+    Pass the returned version to other per-version caches (e.g. _summaries())
+    instead of calling _data_mtimes() again, so a write by another session
+    in between cannot file old data under the new version.
+
+    Returns:
+        The DataFrame from load_df() and the _data_mtimes() pair it was read at.
+    """
+    ensure_dirs_and_csv()
+    version = _data_mtimes()
+    return _load_df_cached(EXPENSES, *version), version
+
+
+def load_df() -> pd.DataFrame:
+    """Load all expenses from Parquet into a pandas DataFrame.
+
+    The DataFrame is cached and only re-read when the modification time of
+    the Parquet file or the inbox changes, so Streamlit reruns do not
+    re-read the files. Rows in the inbox are appended after stored rows.
+
+    Returns:
+        A DataFrame with columns: Date, Amount, Category, Description.
+        If there are no expenses yet, an empty DataFrame is returned.
+    """
+    return load_df_with_version()[0]
+
+
 def save_df(df: pd.DataFrame) -> None:
-    """Save the given expenses DataFrame back to the CSV file.
+    """Save the given expenses DataFrame back to the Parquet file.
+
+    The function normalizes the column order and column types before writing,
+    removes the inbox (its rows are part of `df`), then clears the cached
+    DataFrame so the next load sees the new data.
+
+    Args:
+        df: The full expenses DataFrame, as returned by load_df().
+    """
+    # Normalized columns go straight into the output frame (no full copy of df)
+    amount = pd.to_numeric(df["Amount"], errors="coerce").fillna(0.0).round(2)
+    out = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(df["Date"], errors="coerce").dt.normalize(),
+            "Amount": amount,
+            "Category": df["Category"].astype("string[pyarrow]"),
+            "Description": df["Description"].astype("string[pyarrow]"),
+        }
+    )
+    table = pa.Table.from_pandas(out, schema=EXPENSES_SCHEMA, preserve_index=False)
+    if not df.index.is_monotonic_increasing:
+        # Write rows back in their on-disk (insertion) order, not date order
+        table = table.take(np.argsort(df.index.to_numpy(), kind="stable"))
+    # Write to a temp file and swap it in, so readers never see a partial file
+    tmp = EXPENSES + ".tmp"
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, EXPENSES)
+    if os.path.exists(INBOX):
+        os.remove(INBOX)
+    _load_df_cached.clear()
+
 
-    The function normalizes the column order and amount type before writing.
+def append_row(row: dict) -> None:
+    """Append a single expense to the inbox CSV without rewriting the data file.
+
+    Once the inbox grows past INBOX_COMPACT_BYTES it is compacted into the
+    Parquet file via save_df().
 
     Args:
-        df: A DataFrame with at least the DF_COLS columns.
+        row: A mapping with Date, Amount, Category and Description keys.
     """
-    out = df.copy()
-    out = out.reindex(columns=DF_COLS)
-    out["Amount"] = pd.to_numeric(out["Amount"], errors="coerce").fillna(0.0).round(2)
-    out.to_csv(CSV, index=False)
+    ensure_dirs_and_csv()
+    with open(INBOX, "a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(
+            [
+                pd.Timestamp(row["Date"]).strftime(DATE_FMT),
+                f"{float(row['Amount']):.2f}",
+                row["Category"],
+                row["Description"],
+            ]
+        )
+    _load_df_cached.clear()
+    if os.path.getsize(INBOX) > INBOX_COMPACT_BYTES:
+        save_df(load_df())  # fold the grown inbox into the Parquet file
 
 
 # --------------- Categories Config ----------------
@@ -99,25 +259,39 @@ def ensure_categories_file() -> None:
 
     If the JSON file does not exist, create it with DEFAULT_CATEGORIES.
     """
-    os.makedirs(CSV_DIR, exist_ok=True)
     if not os.path.exists(CATS_JSON):
+        os.makedirs(CSV_DIR, exist_ok=True)
         with open(CATS_JSON, "w", encoding="utf-8") as f:
             json.dump(DEFAULT_CATEGORIES, f)
 
 
-def load_categories() -> list[str]:
-    """Load categories from JSON, normalize casing, remove duplicates.
+@st.cache_data(show_spinner=False)
+def _load_categories_cached(path: str, mtime: float) -> list[str]:
+    """Read and normalize the categories JSON (cached per modification time).
+
+    Args:
+        path: Path to the categories JSON file.
+        mtime: Modification time of the file; only used as part of the cache key.
 
     Returns:
         A sorted list of unique category names in title case.
     """
-    ensure_categories_file()
-    with open(CATS_JSON, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8") as f:
         cats = json.load(f)
     norm = sorted({c.strip().title() for c in cats if c and c.strip()})
     return norm
 
 
+def load_categories() -> list[str]:
+    """Load categories from JSON, normalize casing, remove duplicates.
+
+    Returns:
+        A sorted list of unique category names in title case.
+    """
+    ensure_categories_file()
+    return _load_categories_cached(CATS_JSON, os.path.getmtime(CATS_JSON))
+
+
 def save_categories(categories: list[str]) -> None:
     """Save categories back to JSON with normalized casing.
 
@@ -125,28 +299,107 @@ def save_categories(categories: list[str]) -> None:
         categories: A list of category names to be saved.
     """
     norm = sorted({c.strip().title() for c in categories if c and c.strip()})
+    if norm == load_categories():
+        return  # nothing changed; skip the rewrite
     with open(CATS_JSON, "w", encoding="utf-8") as f:
         json.dump(norm, f)
+    _load_categories_cached.clear()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _category_options_cached(
+    cats_mtime: float, version: tuple[float, float], _df: pd.DataFrame
+) -> list[str]:
+    """Union of configured and in-data categories (cached per file versions).
+
+    Args:
+        cats_mtime: Modification time of CATS_JSON; part of the cache key.
+        version: Data version returned by load_df_with_version(); part of the key.
+        _df: The full expenses DataFrame (not hashed by Streamlit).
+
+    Returns:
+        A sorted list of unique, non-blank category names.
+    """
+    # Category is Categorical: its categories are the distinct values, no scan
+    cats_data = _df["Category"].cat.categories
+    cats_data = cats_data[cats_data.str.strip() != ""]
+    return sorted(set(load_categories()).union(cats_data))
+
+
+def category_options(df: pd.DataFrame, version: tuple[float, float]) -> list[str]:
+    """Combine categories from the JSON file with those present in the data.
+
+    Args:
+        df: The full expenses DataFrame, as returned by load_df_with_version().
+        version: The data version returned alongside `df`.
+
+    Returns:
+        A sorted list of unique, non-blank category names.
+    """
+    ensure_categories_file()
+    return _category_options_cached(os.path.getmtime(CATS_JSON), version, df)
 
 
 # --------------- Helper Functions ----------------
-def format_option_label(row: pd.Series, idx: int) -> str:
-    """Format a single row as a human-readable label for dropdowns.
+def format_option_labels(df: pd.DataFrame) -> list[str]:
+    """Format every row as a human-readable label for dropdowns.
+
+    Labels are built with column-wise string operations rather than one
+    Series lookup per row.
 
     Args:
-        row: A pandas Series representing one expense row.
-        idx: The original index of the row (used as an identifier).
+        df: An expenses DataFrame; its index labels are used as identifiers.
 
     Returns:
-        A string like: "[12] 2025-01-01 | $10.00 | Food | Short description..."
+        A list of strings like: "[12] 2025-01-01 | $10.00 | Food | Short description..."
     """
-    date = str(row.get("Date", ""))
-    amt = float(row.get("Amount", 0.0))
-    cat = str(row.get("Category", ""))
-    desc = str(row.get("Description", ""))
-    if len(desc) > 40:
-        desc = desc[:37] + "..."
-    return f"[{idx}] {date} | ${amt:.2f} | {cat} | {desc}"
+    desc = df["Description"].astype(str)
+    desc = desc.where(desc.str.len() <= 40, desc.str.slice(0, 37) + "...")
+    labels = (
+        "["
+        + df.index.to_series().astype(str)
+        + "] "
+        + df["Date"].dt.strftime(DATE_FMT).fillna("")
+        + " | $"
+        + df["Amount"].map("{:.2f}".format)
+        + " | "
+        + df["Category"].astype(str)
+        + " | "
+        + desc
+    )
+    return labels.tolist()
+
+
+def row_summary(df: pd.DataFrame, idx: int) -> dict:
+    """Return the row labelled `idx` as a dict, with Date formatted as text.
+
+    Args:
+        df: An expenses DataFrame.
+        idx: Index label of the row.
+
+    Returns:
+        A dict with Date (YYYY-MM-DD), Amount, Category and Description.
+    """
+    row = df.loc[idx, DF_COLS].to_dict()
+    row["Date"] = row["Date"].strftime(DATE_FMT) if pd.notna(row["Date"]) else ""
+    return row
+
+
+def category_mask(categories: pd.Series, name: str) -> np.ndarray:
+    """Case-insensitive equality mask for a Categorical Category column.
+
+    Only the distinct categories are lowercased; rows are then matched by
+    their integer codes, so no per-row string is allocated.
+
+    Args:
+        categories: A Categorical Series of category names.
+        name: Category name to match (any casing).
+
+    Returns:
+        A numpy boolean array, True where the row's category matches `name`.
+    """
+    wanted = np.flatnonzero(categories.cat.categories.str.lower() == name.lower())
+    return np.isin(categories.cat.codes.to_numpy(), wanted)
 
 
 def filter_df(
@@ -159,7 +412,7 @@ def filter_df(
     """Filter the expenses DataFrame by category, date range, and text.
 
     Args:
-        df: Full expenses DataFrame.
+        df: Full expenses DataFrame, sorted by Date as returned by load_df().
         category: Category name to filter by, or 'All'/None for no filter.
         start: Optional start date (inclusive).
         end: Optional end date (inclusive).
@@ -168,39 +421,136 @@ def filter_df(
     Returns:
         A filtered DataFrame containing only matching rows.
     """
+    if start or end:
+        # Date is sorted by load_df() (NaT last): bracket the range with
+        # binary searches instead of scanning every row.
+        dates = df["Date"].to_numpy()
+        lo = dates.searchsorted(np.datetime64(start), "left") if start else 0
+        if end:
+            hi = dates.searchsorted(np.datetime64(end), "right")
+        else:
+            hi = dates.searchsorted(np.datetime64("NaT"), "left")  # skip NaT rows
+        df = df.iloc[lo:hi]
     if df.empty:
         return df
-    mask = pd.Series(True, index=df.index)
+    # Each active filter contributes a numpy boolean array; they are ANDed
+    # once and applied with a single positional take.
+    masks: list[np.ndarray] = []
 
     if category and category != "All":
-        mask &= df["Category"].str.lower().eq(category.lower())
-
-    if start:
-        mask &= df["Date"] >= start.isoformat()
-    if end:
-        mask &= df["Date"] <= end.isoformat()
+        masks.append(category_mask(df["Category"], category))
 
     if text:
-        # GOTCHA: This text search converts the whole row to a single string,
-        # which is simple but can be slow for very large datasets.
-        blob = df.astype(str).apply(lambda row: " ".join(row.values).lower(), axis=1)
-        mask &= blob.str.contains(text.lower(), na=False)
+        # `_search` is already lowercased by load_df(); Arrow does the scan
+        hits = pc.match_substring(pa.array(df["_search"]), text.lower())
+        masks.append(pc.fill_null(hits, False).to_numpy(zero_copy_only=False))
+
+    if not masks:
+        return df
+    return df.iloc[np.logical_and.reduce(masks)]
+
 
-    return df[mask]
+# Every append creates a new version; keep only the most recent few
+@st.cache_data(show_spinner=False, max_entries=4)
+def _summaries(
+    version: tuple[float, float], _df: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Compute the totals tables by category, by date and by month.
+
+    Cached per data version, so the dashboard and every Summaries tab share
+    one computation across reruns.
+
+    Args:
+        version: Data version returned by load_df_with_version(); the cache key.
+        _df: The full expenses DataFrame (not hashed by Streamlit).
+
+    Returns:
+        Three DataFrames with columns (Category, Total), (Date, Total) and
+        (Month, Total). Dates and months are formatted as strings.
+    """
+    # Factorize each key once and sum Amount with bincount per key
+    amt = _df["Amount"].to_numpy()
+    cat_codes, cats = pd.factorize(_df["Category"], sort=True, use_na_sentinel=False)
+    date_codes, dates = pd.factorize(_df["Date"], sort=True, use_na_sentinel=False)
+    month_codes, months = pd.factorize(
+        _df["Date"].dt.to_period("M"), sort=True, use_na_sentinel=False
+    )
+    # A single pass over Amount fills a Category x Month grid; the category
+    # and month breakdowns are its row and column sums.
+    grid = np.bincount(
+        cat_codes * len(months) + month_codes,
+        weights=amt,
+        minlength=len(cats) * len(months),
+    ).reshape(len(cats), len(months))
+    by_cat = pd.DataFrame(
+        {"Category": cats, "Total": grid.sum(axis=1).round(2)}
+    ).sort_values("Total", ascending=False, ignore_index=True)
+    by_date = pd.DataFrame(
+        {
+            "Date": dates.strftime(DATE_FMT),
+            "Total": np.bincount(
+                date_codes, weights=amt, minlength=len(dates)
+            ).round(2),
+        }
+    )
+    by_month = pd.DataFrame(
+        {"Month": months.astype(str), "Total": grid.sum(axis=0).round(2)}
+    )
+    return by_cat, by_date, by_month
+
+
+def drop_row(df: pd.DataFrame, idx: int) -> pd.DataFrame:
+    """Return `df` without the row labelled `idx`, using one positional slice.
+
+    Args:
+        df: An expenses DataFrame.
+        idx: Index label of the row to remove.
+
+    Returns:
+        A DataFrame with the remaining rows in their current order.
+    """
+    pos = df.index.get_loc(idx)
+    return df.iloc[np.r_[0:pos, pos + 1 : len(df)]]
+
+
+def update_rows(df: pd.DataFrame, rows: pd.DataFrame) -> None:
+    """Apply edited rows to the expenses data and save it with one write.
+
+    Args:
+        df: The full expenses DataFrame, as returned by load_df().
+        rows: Edited rows with the DF_COLS columns, indexed by the labels of
+            the rows they replace.
+    """
+    rows = rows.assign(
+        Date=pd.to_datetime(rows["Date"], errors="coerce"),
+        Category=rows["Category"].str.strip().str.title(),
+        Description=rows["Description"].fillna("").str.strip(),
+    )
+    # Plain strings, so edits may introduce categories not seen in the data
+    df["Category"] = df["Category"].astype("string[pyarrow]")
+    df.loc[rows.index, DF_COLS] = rows[DF_COLS]
+    save_df(df)
 
 
 def export_csv_bytes(df: pd.DataFrame) -> bytes:
     """Convert a DataFrame to CSV bytes for Streamlit download buttons.
 
+    Uses pyarrow's CSV writer, which emits UTF-8 bytes directly. It quotes
+    the header and every text field, and writes whole amounts without a
+    decimal part (e.g. 10 rather than 10.0).
+
     Args:
         df: The DataFrame to export.
 
     Returns:
         Bytes containing the CSV representation of the DataFrame.
     """
-    buf = io.StringIO()
-    df.to_csv(buf, index=False)
-    return buf.getvalue().encode("utf-8")
+    table = pa.Table.from_pandas(df[DF_COLS], preserve_index=False)
+    # Dates are stored as midnight timestamps; write them as plain dates
+    table = table.set_column(0, "Date", table["Date"].cast(pa.date32()))
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(table, buf)
+    return buf.getvalue().to_pybytes()
 
 
 # --------------- UI Pages ----------------
@@ -217,39 +567,41 @@ def page_dashboard() -> None:
     """
     st.header("📊 Dashboard")
 
-    df = load_df()
+    df, version = load_df_with_version()
     if df.empty:
         st.info("No expenses yet. Use **Add Expense** to create your first entry.")
         return
 
     # Quick stats row (split date range into Start / End)
-    dmin = df["Date"].min()
-    dmax = df["Date"].max()
+    amt_stats = df["Amount"].agg(["sum", "count"])
+    dmin, dmax = df["Date"].agg(["min", "max"])
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
-        st.metric("Total", f"${df['Amount'].sum():.2f}")
+        st.metric("Total", f"${amt_stats['sum']:.2f}")
     with c2:
-        st.metric("Entries", f"{len(df)}")
+        st.metric("Entries", f"{int(amt_stats['count'])}")
     with c3:
-        st.metric("Start", dmin if pd.notna(dmin) else "—")
+        st.metric("Start", dmin.strftime(DATE_FMT) if pd.notna(dmin) else "—")
     with c4:
-        st.metric("End", dmax if pd.notna(dmax) else "—")
+        st.metric("End", dmax.strftime(DATE_FMT) if pd.notna(dmax) else "—")
 
     st.divider()
 
     # Recent expenses
     st.subheader("Recent Expenses")
-    st.dataframe(df.tail(10).reset_index(drop=True), use_container_width=True)
+    # Index labels follow insertion order; rows themselves are sorted by Date
+    recent = np.sort(df.index.to_numpy())[-10:]
+    st.dataframe(
+        df.loc[recent, DF_COLS].reset_index(drop=True),
+        use_container_width=True,
+        column_config=DATE_COLUMN_CONFIG,
+    )
+
+    cat_tbl, _, month_tbl = _summaries(version, df)
 
     # Category breakdown (table + Altair bar chart)
     st.subheader("Category Breakdown")
-    cat_tbl = (
-        df.groupby("Category", dropna=False)["Amount"]
-        .sum()
-        .sort_values(ascending=False)
-        .reset_index()
-    )
     st.dataframe(cat_tbl, use_container_width=True)
 
     if not cat_tbl.empty:
@@ -258,9 +610,9 @@ def page_dashboard() -> None:
             .mark_bar()
             .encode(
                 x=alt.X("Category:N", sort="-y"),
-                y=alt.Y("Amount:Q"),
+                y=alt.Y("Total:Q"),
                 color="Category:N",
-                tooltip=["Category", "Amount"],
+                tooltip=["Category", "Total"],
             )
             .properties(height=300)
         )
@@ -268,14 +620,6 @@ def page_dashboard() -> None:
 
     # Monthly trend (Altair line chart)
     st.subheader("Monthly Spending Trend")
-    months = df.copy()
-    months["Month"] = months["Date"].str.slice(0, 7)
-    month_tbl = (
-        months.groupby("Month", dropna=False)["Amount"]
-        .sum()
-        .reset_index()
-        .sort_values("Month")
-    )
 
     if not month_tbl.empty:
         month_chart = (
@@ -283,8 +627,8 @@ def page_dashboard() -> None:
             .mark_line(point=True)
             .encode(
                 x="Month:N",
-                y="Amount:Q",
-                tooltip=["Month", "Amount"],
+                y="Total:Q",
+                tooltip=["Month", "Total"],
             )
             .properties(height=300)
         )
@@ -296,26 +640,33 @@ def page_dashboard() -> None:
 
     # Monthly budget warnings (for current month)
     st.subheader("Monthly Budget Warnings (this month)")
-    current_month = dt.date.today().isoformat()[:7]
-    this_month = df[df["Date"].str.startswith(current_month)]
+    month_start = pd.Timestamp(dt.date.today().replace(day=1))
+    month_end = month_start + pd.offsets.MonthBegin(1)
+    this_month = df[(df["Date"] >= month_start) & (df["Date"] < month_end)]
 
     if this_month.empty:
         st.info("No expenses recorded for this month yet.")
     else:
-        totals = this_month.groupby("Category")["Amount"].sum()
-        any_warning = False
-        for cat, total in totals.items():
-            budget = CATEGORY_BUDGETS.get(cat)
-            if not budget:
-                continue  # no budget defined for this category
-            any_warning = True
-            if total >= budget:
+        # Per-category totals in one pass, then compare against budgets as arrays
+        codes, cats = pd.factorize(
+            this_month["Category"], sort=True, use_na_sentinel=False
+        )
+        totals = np.bincount(
+            codes, weights=this_month["Amount"].to_numpy(), minlength=len(cats)
+        )
+        budgets = np.array([CATEGORY_BUDGETS.get(c, 0.0) for c in cats])
+        has_budget = budgets > 0  # no warning for categories without a budget
+        over = totals >= budgets
+        close = totals >= 0.8 * budgets
+        for i in np.flatnonzero(has_budget):
+            cat, total, budget = cats[i], totals[i], budgets[i]
+            if over[i]:
                 st.error(f"{cat}: ${total:.2f} / ${budget:.2f} — OVER budget")
-            elif total >= 0.8 * budget:
+            elif close[i]:
                 st.warning(f"{cat}: ${total:.2f} / ${budget:.2f} — close to budget")
             else:
                 st.success(f"{cat}: ${total:.2f} / ${budget:.2f} — within budget")
-        if not any_warning:
+        if not has_budget.any():
             st.info("No budgets defined for the categories used this month.")
 
 
@@ -400,15 +751,13 @@ def page_add() -> None:
         else:
             cat_clean = cat_choice.strip().title()
 
-        df = load_df()
         new_row = {
-            "Date": d.isoformat(),
+            "Date": d,
             "Amount": float(amt),
             "Category": cat_clean,
             "Description": desc.strip(),
         }
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        save_df(df)
+        append_row(new_row)
         st.success("Saved.")
 
         # Reset amount back to 0 for next entry
@@ -426,22 +775,14 @@ def page_view_filter() -> None:
     """
     st.header("👁️ View & Filter")
 
-    df = load_df()
+    df, version = load_df_with_version()
     if df.empty:
         st.info("No expenses yet.")
         return
 
     with st.expander("Filters", expanded=True):
         # Category list: combine categories file + what exists in data
-        cats_conf = load_categories()
-        cats_data = sorted(
-            [
-                c
-                for c in df["Category"].dropna().unique()
-                if str(c).strip() != ""
-            ]
-        )
-        all_cats = sorted(set(cats_conf) | set(cats_data))
+        all_cats = category_options(df, version)
 
         col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
@@ -463,7 +804,8 @@ def page_view_filter() -> None:
             end=end if end else None,
             text=text if text else None,
         )
-        st.session_state["last_view"] = filtered.copy()
+        # No copy needed: the app never mutates a stored view in place
+        st.session_state["last_view"] = filtered
     else:
         filtered = st.session_state["last_view"]
 
@@ -471,7 +813,11 @@ def page_view_filter() -> None:
         st.warning("No matching expenses.")
         return
 
-    st.dataframe(filtered.reset_index(drop=True), use_container_width=True)
+    st.dataframe(
+        filtered[DF_COLS].reset_index(drop=True),
+        use_container_width=True,
+        column_config=DATE_COLUMN_CONFIG,
+    )
 
     st.download_button(
         label="⬇️ Download current view as CSV",
@@ -490,21 +836,17 @@ def page_summaries() -> None:
         - By Month: totals per month (table + line chart)
     """
     st.header("📈 Summaries")
-    df = load_df()
+    df, version = load_df_with_version()
     if df.empty:
         st.info("No expenses yet.")
         return
 
+    by_cat, by_date, by_month = _summaries(version, df)
     tabs = st.tabs(["By Category", "By Date", "By Month"])
 
     # By Category
     with tabs[0]:
-        tbl = (
-            df.groupby("Category", dropna=False)["Amount"]
-            .sum()
-            .reset_index(name="Total")
-            .sort_values("Total", ascending=False)
-        )
+        tbl = by_cat
         st.dataframe(tbl, use_container_width=True)
         if not tbl.empty:
             cat_chart = (
@@ -522,12 +864,7 @@ def page_summaries() -> None:
 
     # By Date
     with tabs[1]:
-        tbl = (
-            df.groupby("Date", dropna=False)["Amount"]
-            .sum()
-            .reset_index(name="Total")
-            .sort_values("Date")
-        )
+        tbl = by_date
         st.dataframe(tbl, use_container_width=True)
         if not tbl.empty:
             date_chart = (
@@ -544,14 +881,7 @@ def page_summaries() -> None:
 
     # By Month
     with tabs[2]:
-        m = df.copy()
-        m["Month"] = m["Date"].str.slice(0, 7)
-        tbl = (
-            m.groupby("Month", dropna=False)["Amount"]
-            .sum()
-            .reset_index(name="Total")
-            .sort_values("Month")
-        )
+        tbl = by_month
         st.dataframe(tbl, use_container_width=True)
         if not tbl.empty:
             month_chart = (
@@ -572,11 +902,11 @@ def page_edit() -> None:
 
     Allows the user to:
         - Filter entries by month and category
-        - Select a specific entry
-        - Update date, amount, category, and description
+        - Edit date, amount, category, and description directly in a table
+        - Save all changed rows with a single write
     """
     st.header("✏️ Edit Entry")
-    df = load_df()
+    df, version = load_df_with_version()
     if df.empty:
         st.info("No expenses to edit.")
         return
@@ -584,77 +914,63 @@ def page_edit() -> None:
     # Filters for Edit page (month + category)
     with st.expander("Filters (optional)", expanded=False):
         # Months from data
-        months = sorted(df["Date"].str.slice(0, 7).dropna().unique().tolist())
+        months = sorted(
+            str(p) for p in df["Date"].dt.to_period("M").dropna().unique()
+        )
         months = ["All"] + months
         month_sel = st.selectbox("Month", options=months, index=0)
 
-        cats_conf = load_categories()
-        cats_data = sorted(
-            [
-                c
-                for c in df["Category"].dropna().unique()
-                if str(c).strip() != ""
-            ]
-        )
-        all_cats = sorted(set(cats_conf) | set(cats_data))
+        all_cats = category_options(df, version)
         categories = ["All"] + all_cats
         cat_sel = st.selectbox("Category", options=categories, index=0)
 
-    df_filtered = df.copy()
+    df_filtered = df
     if month_sel != "All":
-        df_filtered = df_filtered[df_filtered["Date"].str.slice(0, 7) == month_sel]
-    if cat_sel != "All":
         df_filtered = df_filtered[
-            df_filtered["Category"].str.lower() == cat_sel.lower()
+            df_filtered["Date"].dt.to_period("M") == pd.Period(month_sel, "M")
         ]
+    if cat_sel != "All":
+        df_filtered = df_filtered[category_mask(df_filtered["Category"], cat_sel)]
 
     if df_filtered.empty:
         st.warning("No entries match the selected filters.")
         return
 
-    # GOTCHA: For very large datasets, this dropdown might still be long.
-    # Filters above help reduce the number of options.
-    options = [
-        format_option_label(df_filtered.loc[idx], idx) for idx in df_filtered.index
-    ]
-    choice = st.selectbox("Select an entry to edit", options=options)
-    idx = int(choice.split("]")[0].lstrip("[")) if choice else None
-    row = df.loc[idx] if idx is not None else None
-
-    if row is not None:
-        with st.form("edit_form"):
-            d = st.date_input(
-                "Date",
-                value=dt.date.fromisoformat(
-                    str(row["Date"]) or dt.date.today().isoformat()
-                ),
-            )
-            amt = st.number_input(
-                "Amount",
-                min_value=0.0,
-                step=1.0,
-                value=float(row["Amount"]),
-                format="%.2f",
-            )
-            cats = load_categories()
-            if row["Category"] in cats:
-                cat = st.selectbox(
-                    "Category", options=cats, index=cats.index(row["Category"])
-                )
-            else:
-                cat = st.selectbox("Category", options=cats, index=0)
-            desc = st.text_input("Description", value=str(row["Description"] or ""))
-            submitted = st.form_submit_button("Update")
+    # The editor tracks edits by row position, so its state is keyed on the
+    # filters and data version; changing either starts a fresh editor.
+    view = df_filtered[DF_COLS].astype({"Category": "string[pyarrow]"})
+    edited = st.data_editor(
+        view,
+        key=f"edit_editor_{month_sel}_{cat_sel}_{version}",
+        num_rows="fixed",
+        use_container_width=True,
+        column_config={
+            "Date": st.column_config.DateColumn(
+                "Date", format="YYYY-MM-DD", required=True
+            ),
+            "Amount": st.column_config.NumberColumn(
+                "Amount", min_value=0.0, step=0.01, format="%.2f", required=True
+            ),
+            "Category": st.column_config.SelectboxColumn(
+                "Category", options=all_cats, required=True
+            ),
+            "Description": st.column_config.TextColumn("Description"),
+        },
+    )
 
-        if submitted:
-            cat_clean = cat.strip()
-            if not cat_clean:
-                st.error("Category cannot be blank.")
-                return
-            df.loc[idx] = [d.isoformat(), float(amt), cat_clean.title(), desc.strip()]
-            save_df(df)
-            st.success("Updated.")
-            st.rerun()
+    if st.button("Save changes"):
+        # A cleared cell compares as <NA>, which all() would skip; count it as changed
+        same = edited.eq(view).fillna(False) | (edited.isna() & view.isna())
+        changed = edited[~same.all(axis=1)]
+        if changed.empty:
+            st.info("No changes to save.")
+            return
+        if (changed["Category"].fillna("").str.strip() == "").any():
+            st.error("Category cannot be blank.")
+            return
+        update_rows(df, changed)
+        st.success(f"Updated {len(changed)} entries.")
+        st.rerun()
 
 
 def page_delete() -> None:
@@ -672,18 +988,18 @@ def page_delete() -> None:
 
     # Delete by index
     st.subheader("Delete by Index")
-    options = [format_option_label(df.iloc[i], i) for i in range(len(df))]
+    options = format_option_labels(df)
     choice = st.selectbox(
         "Select an entry to delete", options=options, key="delete_select"
     )
     idx = int(choice.split("]")[0].lstrip("[")) if choice else None
 
     if idx is not None:
-        st.warning(f"About to delete: {df.iloc[idx].to_dict()}")
+        st.warning(f"About to delete: {row_summary(df, idx)}")
         col1, col2 = st.columns(2)
         with col1:
             if st.button("Confirm Delete", type="primary"):
-                df = df.drop(df.index[idx]).reset_index(drop=True)
+                df = drop_row(df, idx)
                 save_df(df)
                 st.success("Deleted.")
                 st.rerun()
@@ -694,8 +1010,10 @@ def page_delete() -> None:
     st.subheader("Undo: delete last added entry")
     if st.button("Undo last add"):
         if not df.empty:
-            last = df.iloc[-1].to_dict()
-            df = df.iloc[:-1].reset_index(drop=True)
+            # Index labels follow insertion order, so the newest row has the max
+            last_idx = df.index.max()
+            last = row_summary(df, last_idx)
+            df = drop_row(df, last_idx)
             save_df(df)
             st.success(f"Undid last entry: {last}")
             st.rerun()
@@ -817,7 +1135,7 @@ def main() -> None:
             ],
             index=0,
         )
-        st.caption("Tip: Data persists in data/expenses.csv")
+        st.caption("Tip: Data persists in data/expenses.parquet")
 
     if page == "Dashboard":
         page_dashboard()